@@ -1,12 +1,13 @@
 """WABridge - Python client for WABridge WhatsApp HTTP API."""
 
-from .client import AsyncWABridge, WABridge
+from .client import AsyncWABridge, WABridge, default
 from .exceptions import ConnectionError, ValidationError, WABridgeError
 
 __version__ = "0.2.0"
 __all__ = [
     "WABridge",
     "AsyncWABridge",
+    "default",
     "WABridgeError",
     "ConnectionError",
     "ValidationError",
@@ -1,13 +1,166 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Tuple, Union
+import json
+import os
+import random
+import threading
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .exceptions import ConnectionError, ValidationError, WABridgeError
 
+# JSON codec: orjson when installed (``pip install wabridge[fast]``),
+# otherwise the stdlib. Both decode raw bytes and encode straight to bytes.
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _error_message(response: httpx.Response) -> str:
+    """Extract the server's error message, tolerating non-JSON bodies (e.g. proxy 5xx pages)."""
+    try:
+        return _loads(response.content).get("error", "Unknown error")
+    except Exception:
+        return response.text or "Unknown error"
+
+
+def _check_batch_results(results, expected: int) -> List[dict]:
+    """Ensure a /send/batch reply holds exactly one result per message, in order."""
+    if not isinstance(results, list) or len(results) != expected:
+        got = f"{len(results)} results" if isinstance(results, list) else type(results).__name__
+        raise WABridgeError(f"Unexpected /send/batch response: expected a list of {expected} results, got {got}")
+    return results
+
+
+# Warm-up requests are best-effort; never let them hold up the caller for long.
+_WARMUP_TIMEOUT = 2.0
+
+# Ceiling for the exponential retry delay of parallel sends, in seconds.
+_MAX_BACKOFF = 5.0
+
+
+def _retry_delay(backoff: float, attempt: int) -> float:
+    """Exponential backoff with a ceiling and a little jitter."""
+    return min(backoff * 2**attempt, _MAX_BACKOFF) + random.random() * 0.05
+
+
+# Default number of messages per /send/batch request.
+_BATCH_CHUNK_SIZE = 100
+
+# Upper bound for auto-tuned parallel sends; beyond this, requests contend
+# on the connection pool instead of adding throughput.
+_MAX_AUTO_WORKERS = 32
+
+
+def _auto_workers(count: int) -> int:
+    """Pick a worker count for ``count`` parallel sends.
+
+    Honours the ``WABRIDGE_MAX_WORKERS`` environment variable as a cap,
+    otherwise scales with the CPU count within ``[8, 32]``.
+    """
+    try:
+        cap = int(os.environ["WABRIDGE_MAX_WORKERS"])
+    except (KeyError, ValueError):
+        cap = min(max(8, (os.cpu_count() or 4) * 4), _MAX_AUTO_WORKERS)
+    return max(1, min(count, cap))
+
+
+def _image_content(image: str, caption, mimetype, filename, ptt) -> dict:
+    return {"image": image, "caption": caption} if caption else {"image": image}
+
+
+def _video_content(video: str, caption, mimetype, filename, ptt) -> dict:
+    return {"video": video, "caption": caption} if caption else {"video": video}
+
+
+def _audio_content(audio: str, caption, mimetype, filename, ptt) -> dict:
+    return {"audio": audio, "ptt": ptt} if ptt is not None else {"audio": audio}
+
+
+def _document_content(document: str, caption, mimetype, filename, ptt) -> dict:
+    fields = (("document", document), ("mimetype", mimetype), ("fileName", filename), ("caption", caption))
+    return {key: value for key, value in fields if value}
+
+
+# Media payload builders, in precedence order when several kwargs are given.
+_BUILDERS = {
+    "image": _image_content,
+    "video": _video_content,
+    "audio": _audio_content,
+    "document": _document_content,
+}
+
+
+def _build_content(
+    message: Optional[str] = None,
+    image: Optional[str] = None,
+    video: Optional[str] = None,
+    audio: Optional[str] = None,
+    document: Optional[str] = None,
+    caption: Optional[str] = None,
+    mimetype: Optional[str] = None,
+    filename: Optional[str] = None,
+    ptt: Optional[bool] = None,
+) -> dict:
+    """Build content payload from media/text kwargs."""
+    for kind, value in (("image", image), ("video", video), ("audio", audio), ("document", document)):
+        if value:
+            return _BUILDERS[kind](value, caption, mimetype, filename, ptt)
+    return {"message": message} if message else {}
+
+
+class _LoopThread:
+    """Process-wide event loop running in a daemon thread.
+
+    Lets the sync client fan out parallel sends through AsyncWABridge
+    without starting a thread per request or a new event loop per call.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        # Also called in forked children: the parent's loop thread doesn't
+        # exist there, so a fresh loop (and lock) must be built on demand.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._pid != os.getpid():
+            self._reset()
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="wabridge-loop", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coro):
+        """Run ``coro`` on the background loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_loop_thread = _LoopThread()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_loop_thread._reset)
+
 
 class WABridge:
     """Sync client for WABridge - WhatsApp HTTP API.
@@ -27,59 +180,83 @@ class WABridge:
         wa.send(image="https://example.com/photo.jpg")   # image to self
     """
 
-    def __init__(self, host: str = "localhost", port: int = 3000, timeout: float = 30.0):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 3000,
+        timeout: float = 30.0,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        warmup: bool = True,
+        retries: int = 3,
+        backoff: float = 0.1,
+    ):
+        """Create a client.
+
+        Args:
+            host: WABridge server host.
+            port: WABridge server port.
+            timeout: Request timeout in seconds.
+            max_connections: Max concurrent connections in the pool.
+            max_keepalive_connections: Max idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Enable HTTP/2 (requires ``pip install wabridge[http2]``).
+            warmup: Open a connection when entering the context manager, so
+                    the first send doesn't pay for connection setup.
+            retries: Times a parallel send (or /send/batch chunk) is retried
+                     when the server answers 500 (WhatsApp briefly not connected).
+            backoff: Base delay in seconds between retries; doubles on each
+                     attempt, plus a little jitter.
+        """
+        if retries < 0:
+            raise ValueError(f"retries must be >= 0, got {retries}")
+        if backoff < 0:
+            raise ValueError(f"backoff must be >= 0, got {backoff}")
         self.base_url = f"http://{host}:{port}"
         self.timeout = timeout
-        self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout, limits=limits, http2=http2)
+        # Absolute URLs for the send endpoints, parsed once instead of per request.
+        self._url_send = httpx.URL(self.base_url + "/send")
+        self._url_send_self = httpx.URL(self.base_url + "/send/self")
+        self._url_send_group = httpx.URL(self.base_url + "/send/group")
+        self._url_send_channel = httpx.URL(self.base_url + "/send/channel")
+        self._url_send_batch = httpx.URL(self.base_url + "/send/batch")
+        self._warmup = warmup
+        # Parallel sends run on a lazily created async client driven by the
+        # shared background loop (see _LoopThread).
+        self._async_options = dict(
+            host=host,
+            port=port,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            retries=retries,
+            backoff=backoff,
+        )
+        self._async_impl: Optional[AsyncWABridge] = None
+        self._async_pid = os.getpid()
+        self._async_lock = threading.Lock()
 
     def _handle_error(self, response: httpx.Response) -> None:
-        if response.status_code == 200:
+        code = response.status_code
+        if code == 200:
             return
-        data = response.json()
-        error = data.get("error", "Unknown error")
-        if response.status_code == 500:
+        error = _error_message(response)
+        if code == 500:
             raise ConnectionError(error, status_code=500)
-        if response.status_code == 400:
+        if code == 400:
             raise ValidationError(error, status_code=400)
-        raise WABridgeError(error, status_code=response.status_code)
-
-    def _build_content(
-        self,
-        message: Optional[str] = None,
-        image: Optional[str] = None,
-        video: Optional[str] = None,
-        audio: Optional[str] = None,
-        document: Optional[str] = None,
-        caption: Optional[str] = None,
-        mimetype: Optional[str] = None,
-        filename: Optional[str] = None,
-        ptt: Optional[bool] = None,
-    ) -> dict:
-        """Build content payload from media/text kwargs."""
-        payload: dict = {}
-        if image:
-            payload["image"] = image
-            if caption:
-                payload["caption"] = caption
-        elif video:
-            payload["video"] = video
-            if caption:
-                payload["caption"] = caption
-        elif audio:
-            payload["audio"] = audio
-            if ptt is not None:
-                payload["ptt"] = ptt
-        elif document:
-            payload["document"] = document
-            if mimetype:
-                payload["mimetype"] = mimetype
-            if filename:
-                payload["fileName"] = filename
-            if caption:
-                payload["caption"] = caption
-        elif message:
-            payload["message"] = message
-        return payload
+        raise WABridgeError(error, status_code=code)
 
     def status(self) -> dict:
         """Check WhatsApp connection status.
@@ -90,12 +267,13 @@ class WABridge:
         """
         r = self._client.get("/status")
         self._handle_error(r)
-        return r.json()
+        return _loads(r.content)
 
     def is_connected(self) -> bool:
         """Check if WhatsApp is connected and ready."""
         try:
-            return self.status().get("status") == "open"
+            r = self._client.get("/status")
+            return r.status_code == 200 and _loads(r.content).get("status") == "open"
         except Exception:
             return False
 
@@ -107,13 +285,13 @@ class WABridge:
         """
         r = self._client.get("/groups")
         self._handle_error(r)
-        return r.json().get("groups", [])
+        return _loads(r.content).get("groups", [])
 
     def send(
         self,
         phone_or_message: Union[str, List[Tuple[str, str]]] = None,
         message: Optional[str] = None,
-        max_workers: int = 5,
+        max_workers: Optional[int] = None,
         *,
         image: Optional[str] = None,
         video: Optional[str] = None,
@@ -145,7 +323,9 @@ class WABridge:
             phone_or_message: A phone number (str), a message to self (str), or
                               a list of (phone, message) tuples for parallel sends.
             message: Text message (required when first arg is a phone number and no media).
-            max_workers: Max concurrent threads for parallel sends (default 5).
+            max_workers: Max concurrent requests for parallel sends. Defaults to
+                         the message count, capped by WABRIDGE_MAX_WORKERS or
+                         a CPU-based limit (at most 32).
             image: URL of image to send.
             video: URL of video to send.
             audio: URL of audio to send.
@@ -158,33 +338,33 @@ class WABridge:
         Returns:
             dict for single sends, list of dicts for parallel sends.
         """
-        has_media = any([image, video, audio, document])
+        has_media = image or video or audio or document
 
         # List of tuples -> parallel send (text only)
         if isinstance(phone_or_message, list):
-            return self._send_many(phone_or_message, max_workers)
+            return self.send_many(phone_or_message, max_workers)
 
-        content = self._build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
+        content = _build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
 
         # No first arg -> send to self (media or text must be in kwargs)
         if phone_or_message is None:
-            r = self._client.post("/send/self", json=content)
+            r = self._client.post(self._url_send_self, content=_dumps(content), headers=_JSON_HEADERS)
             self._handle_error(r)
-            return r.json()
+            return _loads(r.content)
 
         # Has media -> first arg is phone number
         if has_media:
             payload = {"phone": phone_or_message, **content}
-            r = self._client.post("/send", json=payload)
+            r = self._client.post(self._url_send, content=_dumps(payload), headers=_JSON_HEADERS)
             self._handle_error(r)
-            return r.json()
+            return _loads(r.content)
 
         # Single string, no message -> send to self
         if message is None:
             return self._send_self(phone_or_message)
 
         # Phone + message -> send to contact
-        return self._send_to(phone_or_message, message)
+        return self.send_one(phone_or_message, message)
 
     def send_group(
         self,
@@ -211,11 +391,11 @@ class WABridge:
             filename: File name for document.
             ptt: True for voice note, False for audio file.
         """
-        content = self._build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
+        content = _build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
         payload = {"groupId": group_id, **content}
-        r = self._client.post("/send/group", json=payload)
+        r = self._client.post(self._url_send_group, content=_dumps(payload), headers=_JSON_HEADERS)
         self._handle_error(r)
-        return r.json()
+        return _loads(r.content)
 
     def send_channel(
         self,
@@ -242,52 +422,111 @@ class WABridge:
             filename: File name for document.
             ptt: True for voice note, False for audio file.
         """
-        content = self._build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
+        content = _build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
         payload = {"channelId": channel_id, **content}
-        r = self._client.post("/send/channel", json=payload)
+        r = self._client.post(self._url_send_channel, content=_dumps(payload), headers=_JSON_HEADERS)
         self._handle_error(r)
-        return r.json()
+        return _loads(r.content)
 
-    def _send_to(self, phone: str, message: str) -> dict:
-        r = self._client.post("/send", json={"phone": phone, "message": message})
-        self._handle_error(r)
-        return r.json()
+    def send_one(self, phone: str, message: str) -> dict:
+        """Send a text message to a phone number.
 
-    def _send_self(self, message: str) -> dict:
-        r = self._client.post("/send/self", json={"message": message})
+        Skips the argument detection done by ``send``; use it for sends in
+        tight loops.
+        """
+        r = self._client.post(
+            self._url_send, content=_dumps({"phone": phone, "message": message}), headers=_JSON_HEADERS
+        )
         self._handle_error(r)
-        return r.json()
+        return _loads(r.content)
 
-    def _send_many(self, messages: List[Tuple[str, str]], max_workers: int = 5) -> List[dict]:
-        results = [None] * len(messages)
+    def send_many(self, messages: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[dict]:
+        """Send text messages to many numbers in parallel.
 
-        def _do_send(index: int, phone: str, msg: str):
-            try:
-                r = httpx.post(
-                    f"{self.base_url}/send",
-                    json={"phone": phone, "message": msg},
-                    timeout=self.timeout,
-                )
-                if r.status_code == 200:
-                    return index, r.json()
-                data = r.json()
-                return index, {"success": False, "error": data.get("error", "Unknown error"), "to": phone}
-            except Exception as e:
-                return index, {"success": False, "error": str(e), "to": phone}
+        Never raises for individual failures; each failed send is reported as
+        ``{"success": False, "error": ..., "to": phone}`` in its slot.
+
+        Args:
+            messages: List of (phone, message) tuples.
+            max_workers: Max concurrent requests (default: auto-tuned, see ``send``).
+
+        Returns:
+            List of result dicts, in the same order as ``messages``.
+        """
+        if not messages:
+            return []
+        if max_workers is None:
+            max_workers = _auto_workers(len(messages))
+        return _loop_thread.run(self._get_async_impl()._send_many(messages, concurrency=max_workers))
 
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            futures = [pool.submit(_do_send, i, phone, msg) for i, (phone, msg) in enumerate(messages)]
-            for future in as_completed(futures):
-                idx, result = future.result()
-                results[idx] = result
+    def send_batch(self, messages: List[Tuple[str, str]], chunk_size: int = _BATCH_CHUNK_SIZE) -> List[dict]:
+        """Send text messages through the server's batch endpoint.
 
+        Posts up to ``chunk_size`` messages per request to ``/send/batch``
+        instead of one request per message. Requires a WABridge server that
+        reports ``"capabilities": {"batch": true}`` in ``/status``;
+        ``wa.send([...])`` switches to it automatically when available.
+
+        Args:
+            messages: List of (phone, message) tuples.
+            chunk_size: Max messages per request (default 100).
+
+        Returns:
+            List of result dicts, in the same order as ``messages``.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not positive.
+            WABridgeError: If the server's reply is not one result per message.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+        results: List[dict] = []
+        for i in range(0, len(messages), chunk_size):
+            results.extend(self._post_batch(messages[i : i + chunk_size]))
         return results
 
+    def _post_batch(self, chunk: List[Tuple[str, str]]) -> List[dict]:
+        r = self._client.post(
+            self._url_send_batch,
+            content=_dumps([{"phone": phone, "message": msg} for phone, msg in chunk]),
+            headers=_JSON_HEADERS,
+        )
+        self._handle_error(r)
+        return _check_batch_results(_loads(r.content), len(chunk))
+
+    def _send_self(self, message: str) -> dict:
+        r = self._client.post(
+            self._url_send_self, content=_dumps({"message": message}), headers=_JSON_HEADERS
+        )
+        self._handle_error(r)
+        return _loads(r.content)
+
+    def _get_async_impl(self) -> AsyncWABridge:
+        with self._async_lock:
+            if self._async_pid != os.getpid():
+                # Forked child: the inherited client's connections belong to the
+                # parent's loop, so start over instead of touching them.
+                self._async_impl = None
+                self._async_pid = os.getpid()
+            if self._async_impl is None:
+                self._async_impl = AsyncWABridge(**self._async_options)
+            return self._async_impl
+
     def close(self):
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP clients."""
+        with self._async_lock:
+            async_impl, self._async_impl = self._async_impl, None
+            owned = self._async_pid == os.getpid()
+        if async_impl is not None and owned:
+            _loop_thread.run(async_impl.close())
         self._client.close()
 
     def __enter__(self):
+        if self._warmup:
+            try:
+                self._client.get("/status", timeout=min(self.timeout, _WARMUP_TIMEOUT))
+            except Exception:
+                pass
         return self
 
     def __exit__(self, *args):
@@ -311,71 +550,84 @@ class AsyncWABridge:
             await wa.send("919876543210", image="https://example.com/photo.jpg")
     """
 
-    def __init__(self, host: str = "localhost", port: int = 3000, timeout: float = 30.0):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 3000,
+        timeout: float = 30.0,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        warmup: bool = True,
+        retries: int = 3,
+        backoff: float = 0.1,
+    ):
+        """Create a client.
+
+        Args:
+            host: WABridge server host.
+            port: WABridge server port.
+            timeout: Request timeout in seconds.
+            max_connections: Max concurrent connections in the pool.
+            max_keepalive_connections: Max idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Enable HTTP/2 (requires ``pip install wabridge[http2]``).
+            warmup: Open a connection when entering the context manager, so
+                    the first send doesn't pay for connection setup.
+            retries: Times a parallel send (or /send/batch chunk) is retried
+                     when the server answers 500 (WhatsApp briefly not connected).
+            backoff: Base delay in seconds between retries; doubles on each
+                     attempt, plus a little jitter.
+        """
+        if retries < 0:
+            raise ValueError(f"retries must be >= 0, got {retries}")
+        if backoff < 0:
+            raise ValueError(f"backoff must be >= 0, got {backoff}")
         self.base_url = f"http://{host}:{port}"
         self.timeout = timeout
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, limits=limits, http2=http2)
+        # Absolute URLs for the send endpoints, parsed once instead of per request.
+        self._url_send = httpx.URL(self.base_url + "/send")
+        self._url_send_self = httpx.URL(self.base_url + "/send/self")
+        self._url_send_group = httpx.URL(self.base_url + "/send/group")
+        self._url_send_channel = httpx.URL(self.base_url + "/send/channel")
+        self._url_send_batch = httpx.URL(self.base_url + "/send/batch")
+        self._max_keepalive = max_keepalive_connections
+        self._warmup = warmup
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._retries = retries
+        self._backoff = backoff
+        self._server_caps: Optional[dict] = None
 
     def _handle_error(self, response: httpx.Response) -> None:
-        if response.status_code == 200:
+        code = response.status_code
+        if code == 200:
             return
-        data = response.json()
-        error = data.get("error", "Unknown error")
-        if response.status_code == 500:
+        error = _error_message(response)
+        if code == 500:
             raise ConnectionError(error, status_code=500)
-        if response.status_code == 400:
+        if code == 400:
             raise ValidationError(error, status_code=400)
-        raise WABridgeError(error, status_code=response.status_code)
-
-    def _build_content(
-        self,
-        message: Optional[str] = None,
-        image: Optional[str] = None,
-        video: Optional[str] = None,
-        audio: Optional[str] = None,
-        document: Optional[str] = None,
-        caption: Optional[str] = None,
-        mimetype: Optional[str] = None,
-        filename: Optional[str] = None,
-        ptt: Optional[bool] = None,
-    ) -> dict:
-        """Build content payload from media/text kwargs."""
-        payload: dict = {}
-        if image:
-            payload["image"] = image
-            if caption:
-                payload["caption"] = caption
-        elif video:
-            payload["video"] = video
-            if caption:
-                payload["caption"] = caption
-        elif audio:
-            payload["audio"] = audio
-            if ptt is not None:
-                payload["ptt"] = ptt
-        elif document:
-            payload["document"] = document
-            if mimetype:
-                payload["mimetype"] = mimetype
-            if filename:
-                payload["fileName"] = filename
-            if caption:
-                payload["caption"] = caption
-        elif message:
-            payload["message"] = message
-        return payload
+        raise WABridgeError(error, status_code=code)
 
     async def status(self) -> dict:
         """Check WhatsApp connection status."""
         r = await self._client.get("/status")
         self._handle_error(r)
-        return r.json()
+        return _loads(r.content)
 
     async def is_connected(self) -> bool:
         """Check if WhatsApp is connected and ready."""
         try:
-            s = await self.status()
-            return s.get("status") == "open"
+            r = await self._client.get("/status")
+            return r.status_code == 200 and _loads(r.content).get("status") == "open"
         except Exception:
             return False
 
@@ -383,13 +635,15 @@ class AsyncWABridge:
         """List all WhatsApp groups."""
         r = await self._client.get("/groups")
         self._handle_error(r)
-        return r.json().get("groups", [])
+        return _loads(r.content).get("groups", [])
 
     async def send(
         self,
         phone_or_message: Union[str, List[Tuple[str, str]]] = None,
         message: Optional[str] = None,
         *,
+        concurrency: Optional[int] = None,
+        stream: bool = False,
         image: Optional[str] = None,
         video: Optional[str] = None,
         audio: Optional[str] = None,
@@ -398,40 +652,48 @@ class AsyncWABridge:
         mimetype: Optional[str] = None,
         filename: Optional[str] = None,
         ptt: Optional[bool] = None,
-    ) -> Union[dict, List[dict]]:
+    ) -> Union[dict, List[dict], AsyncIterator[Tuple[int, dict]]]:
         """Send a WhatsApp message.
 
+        Parallel sends keep at most ``concurrency`` requests in flight
+        (default: the keep-alive pool size, so in-flight requests match open
+        connections). With ``stream=True`` they return an async iterator of
+        ``(index, result)`` pairs in completion order instead of a list.
+
         Usage:
             await wa.send("Hello!")                                  # text to self
             await wa.send("919876543210", "Hello!")                   # text to a number
             await wa.send([("919876543210", "Hi"), ("91...", "Hey")]) # text to many
 
+            async for i, result in await wa.send(messages, stream=True):
+                ...
+
             # Media
             await wa.send(image="https://example.com/photo.jpg")
             await wa.send("919876543210", image="https://example.com/photo.jpg", caption="Check this")
         """
-        has_media = any([image, video, audio, document])
+        has_media = image or video or audio or document
 
         if isinstance(phone_or_message, list):
-            return await self._send_many(phone_or_message)
+            return await self.send_many(phone_or_message, concurrency=concurrency, stream=stream)
 
-        content = self._build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
+        content = _build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
 
         if phone_or_message is None:
-            r = await self._client.post("/send/self", json=content)
+            r = await self._client.post(self._url_send_self, content=_dumps(content), headers=_JSON_HEADERS)
             self._handle_error(r)
-            return r.json()
+            return _loads(r.content)
 
         if has_media:
             payload = {"phone": phone_or_message, **content}
-            r = await self._client.post("/send", json=payload)
+            r = await self._client.post(self._url_send, content=_dumps(payload), headers=_JSON_HEADERS)
             self._handle_error(r)
-            return r.json()
+            return _loads(r.content)
 
         if message is None:
             return await self._send_self(phone_or_message)
 
-        return await self._send_to(phone_or_message, message)
+        return await self.send_one(phone_or_message, message)
 
     async def send_group(
         self,
@@ -448,11 +710,11 @@ class AsyncWABridge:
         ptt: Optional[bool] = None,
     ) -> dict:
         """Send a message to a WhatsApp group."""
-        content = self._build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
+        content = _build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
         payload = {"groupId": group_id, **content}
-        r = await self._client.post("/send/group", json=payload)
+        r = await self._client.post(self._url_send_group, content=_dumps(payload), headers=_JSON_HEADERS)
         self._handle_error(r)
-        return r.json()
+        return _loads(r.content)
 
     async def send_channel(
         self,
@@ -469,41 +731,241 @@ class AsyncWABridge:
         ptt: Optional[bool] = None,
     ) -> dict:
         """Send a message to a WhatsApp channel/newsletter."""
-        content = self._build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
+        content = _build_content(message, image, video, audio, document, caption, mimetype, filename, ptt)
         payload = {"channelId": channel_id, **content}
-        r = await self._client.post("/send/channel", json=payload)
+        r = await self._client.post(self._url_send_channel, content=_dumps(payload), headers=_JSON_HEADERS)
+        self._handle_error(r)
+        return _loads(r.content)
+
+    async def send_one(self, phone: str, message: str) -> dict:
+        """Send a text message to a phone number. See ``WABridge.send_one``."""
+        r = await self._client.post(
+            self._url_send, content=_dumps({"phone": phone, "message": message}), headers=_JSON_HEADERS
+        )
         self._handle_error(r)
-        return r.json()
+        return _loads(r.content)
 
-    async def _send_to(self, phone: str, message: str) -> dict:
-        r = await self._client.post("/send", json={"phone": phone, "message": message})
+    async def send_many(
+        self,
+        messages: List[Tuple[str, str]],
+        *,
+        concurrency: Optional[int] = None,
+        stream: bool = False,
+    ) -> Union[List[dict], AsyncIterator[Tuple[int, dict]]]:
+        """Send text messages to many numbers in parallel.
+
+        Keeps at most ``concurrency`` requests in flight (default: the
+        keep-alive pool size). Returns results in input order, or with
+        ``stream=True`` an async iterator of ``(index, result)`` pairs in
+        completion order. See ``WABridge.send_many``.
+        """
+        if stream:
+            return self._iter_send_many(messages, concurrency)
+        return await self._send_many(messages, concurrency)
+
+    async def send_batch(self, messages: List[Tuple[str, str]], chunk_size: int = _BATCH_CHUNK_SIZE) -> List[dict]:
+        """Send text messages through the server's batch endpoint.
+
+        See ``WABridge.send_batch``.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+        results: List[dict] = []
+        for i in range(0, len(messages), chunk_size):
+            results.extend(await self._post_batch(messages[i : i + chunk_size]))
+        return results
+
+    async def _post_batch(self, chunk: List[Tuple[str, str]]) -> List[dict]:
+        r = await self._client.post(
+            self._url_send_batch,
+            content=_dumps([{"phone": phone, "message": msg} for phone, msg in chunk]),
+            headers=_JSON_HEADERS,
+        )
         self._handle_error(r)
-        return r.json()
+        return _check_batch_results(_loads(r.content), len(chunk))
+
+    async def _get_server_caps(self) -> dict:
+        """Return the server's advertised capabilities, fetched once from /status."""
+        if self._server_caps is None:
+            try:
+                r = await self._client.get("/status")
+                data = _loads(r.content) if r.status_code == 200 else None
+            except Exception:
+                return {}
+            if not isinstance(data, dict):
+                # Unexpected reply (e.g. a proxy page): assume no extras, retry next time.
+                return {}
+            caps = data.get("capabilities")
+            self._server_caps = caps if isinstance(caps, dict) else {}
+        return self._server_caps
 
     async def _send_self(self, message: str) -> dict:
-        r = await self._client.post("/send/self", json={"message": message})
+        r = await self._client.post(
+            self._url_send_self, content=_dumps({"message": message}), headers=_JSON_HEADERS
+        )
         self._handle_error(r)
-        return r.json()
+        return _loads(r.content)
+
+    async def _send_many(self, messages: List[Tuple[str, str]], concurrency: Optional[int] = None) -> List[dict]:
+        if messages and (await self._get_server_caps()).get("batch"):
+            results: List[dict] = []
+            async for _, chunk_results in self._iter_batches(messages):
+                results.extend(chunk_results)
+            return results
+
+        _do_send = self._make_sender(len(messages), concurrency)
+        return await asyncio.gather(*[_do_send(phone, msg) for phone, msg in messages])
+
+    async def _iter_send_many(
+        self, messages: List[Tuple[str, str]], concurrency: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, dict]]:
+        """Yield ``(index, result)`` pairs as each send completes."""
+        if messages and (await self._get_server_caps()).get("batch"):
+            async for start, chunk_results in self._iter_batches(messages):
+                for offset, result in enumerate(chunk_results):
+                    yield start + offset, result
+            return
+
+        _do_send = self._make_sender(len(messages), concurrency)
+
+        async def _indexed(index: int, phone: str, msg: str) -> Tuple[int, dict]:
+            return index, await _do_send(phone, msg)
+
+        tasks = [asyncio.ensure_future(_indexed(i, phone, msg)) for i, (phone, msg) in enumerate(messages)]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            # Consumer stopped early: don't leave sends running in the background.
+            for task in tasks:
+                task.cancel()
+
+    def _make_sender(self, count: int, concurrency: Optional[int]):
+        """Return a coroutine function that sends one text message and never raises."""
+        if concurrency is None:
+            concurrency = min(count, self._max_keepalive)
+        sem = asyncio.Semaphore(max(1, concurrency))
+        # Bound once for the whole batch rather than looked up per message.
+        post = self._client.post
+        url = self._url_send
+        dumps = _dumps
+        retries, backoff = self._retries, self._backoff
 
-    async def _send_many(self, messages: List[Tuple[str, str]]) -> List[dict]:
         async def _do_send(phone: str, msg: str) -> dict:
             try:
-                r = await self._client.post("/send", json={"phone": phone, "message": msg})
+                body = dumps({"phone": phone, "message": msg})
+                for attempt in range(retries + 1):
+                    async with sem:
+                        r = await post(url, content=body, headers=_JSON_HEADERS)
+                    # Only 500 ("not connected") is known not to have delivered the
+                    # message; a proxy 502/503/504 may arrive after delivery.
+                    if r.status_code != 500 or attempt == retries:
+                        break
+                    # Sleep outside the semaphore so other sends keep the connections busy.
+                    await asyncio.sleep(_retry_delay(backoff, attempt))
                 if r.status_code == 200:
-                    return r.json()
-                data = r.json()
-                return {"success": False, "error": data.get("error", "Unknown error"), "to": phone}
+                    return _loads(r.content)
+                return {"success": False, "error": _error_message(r), "to": phone}
             except Exception as e:
                 return {"success": False, "error": str(e), "to": phone}
 
-        return await asyncio.gather(*[_do_send(phone, msg) for phone, msg in messages])
+        return _do_send
+
+    async def _iter_batches(self, messages: List[Tuple[str, str]]) -> AsyncIterator[Tuple[int, List[dict]]]:
+        """Yield ``(start_index, results)`` per /send/batch chunk, never raising.
+
+        A chunk rejected with 500 ("not connected") is retried like single
+        parallel sends; any other failure is reported for each message.
+        """
+        for i in range(0, len(messages), _BATCH_CHUNK_SIZE):
+            chunk = messages[i : i + _BATCH_CHUNK_SIZE]
+            for attempt in range(self._retries + 1):
+                try:
+                    results = await self._post_batch(chunk)
+                except ConnectionError as e:
+                    if attempt < self._retries:
+                        await asyncio.sleep(_retry_delay(self._backoff, attempt))
+                        continue
+                    results = [{"success": False, "error": str(e), "to": phone} for phone, _ in chunk]
+                except Exception as e:
+                    results = [{"success": False, "error": str(e), "to": phone} for phone, _ in chunk]
+                break
+            yield i, results
+
+    async def _warm(self) -> None:
+        try:
+            await self._client.get("/status", timeout=min(self.timeout, _WARMUP_TIMEOUT))
+        except Exception:
+            pass
 
     async def close(self):
         """Close the underlying HTTP client."""
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            await asyncio.gather(self._warmup_task, return_exceptions=True)
+            self._warmup_task = None
         await self._client.aclose()
 
     async def __aenter__(self):
+        if self._warmup:
+            self._warmup_task = asyncio.create_task(self._warm())
         return self
 
     async def __aexit__(self, *args):
         await self.close()
+
+
+# Shared clients per event loop: httpx async connections belong to the loop
+# that opened them, so each loop (e.g. each asyncio.run) gets its own.
+_default_clients: Dict[asyncio.AbstractEventLoop, Dict[Tuple[str, int], AsyncWABridge]] = {}
+_default_lock = threading.Lock()
+# The loop only holds weak references to tasks; keep the closers alive.
+_default_closers: Set[asyncio.Task] = set()
+
+
+def default(host: str = "localhost", port: int = 3000) -> AsyncWABridge:
+    """Return a shared AsyncWABridge for short-lived callers.
+
+    Reusing one client keeps its connection pool warm across calls, instead
+    of each ``AsyncWABridge()`` opening fresh connections. One client is kept
+    per running event loop and ``(host, port)``, so it is safe to call from
+    successive ``asyncio.run(...)`` jobs. Must be called from inside a running
+    event loop; don't close the returned client.
+
+    The clients are closed when their loop shuts down and cancels its pending
+    tasks, as ``asyncio.run`` does. A loop closed without that step leaks its
+    clients' sockets until garbage collection; they are forgotten on the next
+    call.
+
+    Usage:
+        await wabridge.default().send("919876543210", "Hello!")
+        await wabridge.default(host="192.168.1.100", port=4000).send("Hello!")
+    """
+    loop = asyncio.get_running_loop()
+    with _default_lock:
+        for stale in [key for key in _default_clients if key.is_closed()]:
+            del _default_clients[stale]
+        clients = _default_clients.get(loop)
+        if clients is None:
+            clients = _default_clients[loop] = {}
+            closer = loop.create_task(_close_defaults_at_shutdown(loop))
+            _default_closers.add(closer)
+            closer.add_done_callback(_default_closers.discard)
+        client = clients.get((host, port))
+        if client is None:
+            client = clients[(host, port)] = AsyncWABridge(host, port)
+        return client
+
+
+async def _close_defaults_at_shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    """Idle until the loop cancels its tasks at shutdown, then close its shared clients."""
+    try:
+        await loop.create_future()
+    finally:
+        with _default_lock:
+            clients = _default_clients.pop(loop, {})
+        for client in clients.values():
+            try:
+                await client.close()
+            except Exception:
+                pass
@@ -1,15 +1,28 @@
 class WABridgeError(Exception):
     """Base exception for wabridge."""
 
+    __slots__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int = None):
-        self.message = message
+        super().__init__(message)
         self.status_code = status_code
-        super().__init__(self.message)
+
+    @property
+    def message(self) -> str:
+        return self.args[0]
+
+    def __reduce__(self):
+        # status_code lives in a slot, which default exception pickling skips.
+        return type(self), (self.args[0], self.status_code)
 
 
 class ConnectionError(WABridgeError):
     """WhatsApp is not connected."""
 
+    __slots__ = ()
+
 
 class ValidationError(WABridgeError):
     """Invalid request parameters."""
+
+    __slots__ = ()